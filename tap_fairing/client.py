@@ -1,5 +1,8 @@
 """REST client handling, including fairingStream base class."""
 from pathlib import Path
+from typing import Any, Optional
+
+from requests.adapters import HTTPAdapter
 from singer_sdk.streams import RESTStream
 from singer_sdk.authenticators import APIKeyAuthenticator
 
@@ -14,6 +17,40 @@ class FairingStream(RESTStream):
     records_jsonpath = "$.data[*]"
     http_headers = {"Accept": "application/json"}
 
+    # most requests this stream sends at the same time
+    max_concurrent_requests = 1
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream.
+
+        The session keeps enough connections to the API alive for concurrent requests.
+        """
+        super().__init__(*args, **kwargs)
+        # every request goes to the one API host, so a single pool is enough, but it
+        # has to hold a connection per concurrent request or urllib3 discards the
+        # extras instead of reusing them
+        self.requests_session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrent_requests),
+        )
+
+    def get_url(self, context: Optional[dict]) -> str:
+        """Get stream entity URL.
+
+        The SDK fills in {placeholders} from a copy of the config and context on every
+        call, which is only needed when the url actually has any.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            A URL, optionally targeted to a specific partition or context.
+        """
+        url = "".join([self.url_base, self.path or ""])
+        if "{" in url:
+            return super().get_url(context)
+        return url
+
     @property
     def authenticator(self) -> APIKeyAuthenticator:
         """Return a new authenticator object."""
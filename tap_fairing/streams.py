@@ -1,18 +1,150 @@
 """Stream type classes for tap-fairing."""
 
-from datetime import datetime, timezone
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
-from typing import Any, Dict, Iterable, List, Optional, TypeVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypeVar
 
 import dateutil.parser
+import orjson
 import requests
-from singer_sdk import typing as th  # JSON Schema typing helpers
+from jsonpath_ng.ext import parse as _jp_parse
+from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import BaseAPIPaginator, JSONPathPaginator
 
-from tap_fairing.client import FairingStream
+from tap_fairing.client import SCHEMAS_DIR, FairingStream
 
 _TToken = TypeVar("_TToken")
 
+_NEWEST_ID_EXPR = _jp_parse("$.data[0].id")
+
+
+def _loads(response: requests.Response) -> Any:
+    """Decode a JSON response body with orjson.
+
+    orjson is much faster than the stdlib json used by response.json(). The result is
+    kept on the response, since parse_response and the paginator both read the same
+    page.
+    """
+    body = getattr(response, "_fairing_body", None)
+    if body is None:
+        body = orjson.loads(response.content)
+        response._fairing_body = body  # type: ignore[attr-defined]
+    return body
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, like the start_date or the API's inserted_at.
+
+    datetime.fromisoformat is far faster than dateutil, but before Python 3.11 it only
+    handles the layouts datetime.isoformat produces, so anything else still goes
+    through dateutil. Timestamps without a utc offset are taken to be in utc, so that
+    they can all be compared with each other.
+    """
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        dt = dateutil.parser.isoparse(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _format_iso(dt: datetime) -> str:
+    """Format a datetime the way the API accepts it for the until param."""
+    # isoformat is done in C without strftime; the first 26 characters are the
+    # date and time with microseconds, before the utc offset, so convert to utc first
+    return dt.astimezone(timezone.utc).isoformat(timespec="microseconds")[:26] + "Z"
+
+
+_FLOAT_FIELDS = ("order_total", "order_total_usd")
+_STR_ID_FIELDS = (
+    "question_id",
+    "referring_question_id",
+    "referring_question_response_id",
+    "response_id",
+)
+
+
+def _transform_page(data: List[dict]) -> Iterator[dict]:
+    """Yield the records of a responses page in reverse, oldest first.
+
+    The number types are transformed into floats and the foreign key ids into strings.
+    """
+    # values that already have the right type, like amounts that came through as JSON
+    # numbers, are left alone; an exact type check is cheaper than isinstance
+    _float = float
+    _str = str
+    for row in reversed(data):
+        for k in _FLOAT_FIELDS:
+            v = row.get(k)
+            if v and type(v) is _str:
+                row[k] = _float(v)
+        for k in _STR_ID_FIELDS:
+            v = row.get(k)
+            if v and type(v) is not _str:
+                row[k] = _str(v)
+        yield row
+
+
+class CompiledJSONPathPaginator(JSONPathPaginator):
+    """JSONPathPaginator that reuses an already parsed JSONPath expression."""
+
+    def __init__(self, expr, *args: Any, **kwargs: Any) -> None:
+        """Create a new paginator.
+
+        Args:
+            expr: A parsed JSONPath expression.
+            args: Paginator positional arguments for base class.
+            kwargs: Paginator keyword arguments for base class.
+        """
+        super().__init__(str(expr), *args, **kwargs)
+        self._expr = expr
+
+    def get_next(self, response: requests.Response) -> Optional[str]:
+        """Get the next page token.
+
+        Args:
+            response: API response object.
+
+        Returns:
+            The next page token.
+        """
+        matches = self._expr.find(_loads(response))
+        return matches[0].value if matches else None
+
+
+class NewestIdPaginator(BaseAPIPaginator[Optional[str]]):
+    """Paginator using the id of the newest record in the page as the next token.
+
+    Equivalent to CompiledJSONPathPaginator(_NEWEST_ID_EXPR), without going through
+    the JSONPath evaluator.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create a new paginator.
+
+        Args:
+            args: Paginator positional arguments for base class.
+            kwargs: Paginator keyword arguments for base class.
+        """
+        super().__init__(None, *args, **kwargs)
+
+    def get_next(self, response: requests.Response) -> Optional[str]:
+        """Get the next page token.
+
+        Args:
+            response: API response object.
+
+        Returns:
+            The next page token.
+        """
+        data = _loads(response)["data"]
+        return data[0]["id"] if data else None
+
 
 class ResponsesStream(FairingStream):
     """The responses from the fairing.co API."""
@@ -23,202 +155,44 @@ class ResponsesStream(FairingStream):
     replication_key = "id"
     is_sorted = True
     check_sorted = False
-    schema = th.PropertiesList(
-        th.Property(
-            "id",
-            th.StringType,
-            required=True,
-            description="The unique ID of the response.",
-        ),
-        th.Property("available_responses", th.ArrayType(th.StringType)),
-        th.Property(
-            "clarification_question",
-            th.BooleanType,
-            description="The question for this response was a clarification of a previous question if true.",
-        ),
-        th.Property(
-            "coupon_amount",
-            th.StringType,
-            description="The discount amount applied to the order from the coupon.",
-        ),
-        th.Property(
-            "coupon_code",
-            th.StringType,
-            description="The coupon code used on the order.",
-        ),
-        th.Property(
-            "coupon_type",
-            th.StringType,
-            description="The coupon type used on the order. For Shopify orders, this will be either fixed or percentage.",
-        ),
-        th.Property(
-            "customer_id",
-            th.StringType,
-            description="The ID of customer associated with the order for this response. For Shopify orders, this matches the customer's ID in Shopify.",
-        ),
-        th.Property(
-            "customer_order_count",
-            th.IntegerType,
-            description="The total number of orders the customer had at the time they placed the order associated with this response.",
-        ),
-        th.Property(
-            "email",
-            th.StringType,
-            description="The email address of the customer associated with the order for this response.",
-        ),
-        th.Property(
-            "inserted_at",
-            th.DateTimeType,
-            description="ISO 8601 timestamp of the time the response was created.",
-        ),
-        th.Property(
-            "landing_page_path",
-            th.StringType,
-            description="The first click landing page associated with the order for this response.",
-        ),
-        th.Property(
-            "order_currency_code",
-            th.StringType,
-            description="The three-letter ISO 4217 currency code of the order.",
-        ),
-        th.Property(
-            "order_id",
-            th.StringType,
-            description="The ID of the order associated with this response.",
-        ),
-        th.Property(
-            "order_number",
-            th.StringType,
-            description="The order number of the order associated with this response.",
-        ),
-        th.Property(
-            "order_platform",
-            th.StringType,
-            description="The platform that provided the order information. For Shopify, this will be shopify.",
-        ),
-        th.Property(
-            "order_source",
-            th.StringType,
-            description="The source of the order. For Shopify, this will be shopify_checkout.",
-        ),
-        th.Property(
-            "order_total",
-            th.NumberType,
-            description="The order total in the currency used for payment by the customer.",
-        ),
-        th.Property(
-            "order_total_usd",
-            th.NumberType,
-            description="The order total in U.S. Dollars.",
-        ),
-        th.Property(
-            "other",
-            th.BooleanType,
-            description="Indicates if the response was free-form text.",
-        ),
-        th.Property(
-            "other_response",
-            th.StringType,
-            description="If the response was free-form text, the value of the text.",
-        ),
-        th.Property(
-            "question",
-            th.StringType,
-            description="The text value of the question associated with this response.",
-        ),
-        th.Property(
-            "question_id",
-            th.StringType,
-            description="The ID of the question associated with this response.",
-        ),
-        th.Property(
-            "question_type",
-            th.StringType,
-            description="The type of the question associated with this response. One of single_response, multi_response, or open_ended.",
-        ),
-        th.Property(
-            "referring_question",
-            th.StringType,
-            description="If the question associated with this response is a clarification question, the text value of the question immediately preceeding this one.",
-        ),
-        th.Property(
-            "referring_question_id",
-            th.StringType,
-            description="If the question associated with this response is a clarification question, the ID of the question immediately preceeding this one.",
-        ),
-        th.Property(
-            "referring_question_response",
-            th.StringType,
-            description="If the question associated with this response is a clarification question, the text value of the response provided to the question immediately preceeding this one.",
-        ),
-        th.Property(
-            "referring_question_response_id",
-            th.StringType,
-            description="If the question associated with this response is a clarification question, the ID of the response provided to the question immediately preceeding this one.",
-        ),
-        th.Property(
-            "referring_site",
-            th.StringType,
-            description="The referring site of the order associated with this response.",
-        ),
-        th.Property(
-            "response",
-            th.StringType,
-            description="The text value of the response. This will be null if the response was free-form text.",
-        ),
-        th.Property(
-            "response_id",
-            th.StringType,
-            description="The ID of the response if it was not free-form text.",
-        ),
-        th.Property(
-            "response_position",
-            th.IntegerType,
-            description="The position of this response in the list of all responses to the associated question at the time it was presented to the customer. If the order of responses for a question is configured to be randomized, this value will not always be the same for the same response.",
-        ),
-        th.Property(
-            "response_provided_at",
-            th.DateTimeType,
-            description="ISO 8601 timestamp of the time the response was provided by the customer.",
-        ),
-        th.Property(
-            "submit_delta",
-            th.IntegerType,
-            description="The time, in milliseconds, bewtween when the question was displayed and the response was submitted.",
-        ),
-        th.Property(
-            "updated_at",
-            th.DateTimeType,
-            description="ISO 8601 timestamp of the last time the response was updated.",
-        ),
-        th.Property(
-            "utm_campaign",
-            th.StringType,
-            description="The UTM campaign of the order associated with this response.",
-        ),
-        th.Property(
-            "utm_content",
-            th.StringType,
-            description="The UTM content of the order associated with this response.",
-        ),
-        th.Property(
-            "utm_medium",
-            th.StringType,
-            description="The UTM medium of the order associated with this response.",
-        ),
-        th.Property(
-            "utm_source",
-            th.StringType,
-            description="The UTM source of the order associated with this response.",
-        ),
-        th.Property(
-            "utm_term",
-            th.StringType,
-            description="The UTM term of the order associated with this response.",
-        ),
-    ).to_dict()
-
-    newest_id_jsonpath = "$.data[0].id"
+    schema_filepath = SCHEMAS_DIR / "responses.json"
+
+    # parsed once for the class rather than per paginator
+    newest_id_expr = _NEWEST_ID_EXPR
+
+    max_search_rounds = 64
+
+    @property
+    def search_probes(self) -> int:
+        """Return the number of concurrent probes per round of the search.
+
+        The search looks for the oldest page without state.
+        """
+        return max(1, self.config["search_probes"])
+
+    @property
+    def max_concurrent_requests(self) -> int:  # type: ignore[override]
+        """Return the most requests sent at once.
+
+        That is one more than search_probes, since the first search round also
+        carries the start_date check.
+        """
+        return self.search_probes + 1
+
+    # url params for the first page of a sync, set by get_records
+    _initial_url_params: Optional[dict] = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stream, with the url params reused by every search probe."""
+        super().__init__(*args, **kwargs)
+        # read on every page and probe, and self.config builds a new proxy on each
+        # access
+        self._page_size: int = int(self.config["page_size"])
+        # the search looks for a probe page that isn't full but isn't empty either,
+        # which a page of one can't be. With page_size=1, a partial probe page is then
+        # exactly one record, the first page.
+        self._probe_limit: int = max(2, self._page_size)
+        self._probe_params: dict = {"until": None, "limit": self._probe_limit}
 
     def get_new_paginator(self) -> BaseAPIPaginator:
         """Get a fresh paginator for this API endpoint.
@@ -226,7 +200,9 @@ class ResponsesStream(FairingStream):
         Returns:
             A paginator instance.
         """
-        return JSONPathPaginator(self.newest_id_jsonpath)
+        if self.newest_id_expr is _NEWEST_ID_EXPR:
+            return NewestIdPaginator()
+        return CompiledJSONPathPaginator(self.newest_id_expr)
 
     def get_records(self, context: Optional[dict]) -> Iterable[dict[str, Any]]:
         """Return a generator of record-type dictionary objects.
@@ -249,20 +225,14 @@ class ResponsesStream(FairingStream):
             # incremental run, start from latest id
             initial_url_params = {
                 "before": state["starting_replication_value"],
-                "limit": self.config["page_size"],
+                "limit": self._page_size,
             }
 
         self.logger.info("Starting replication with params %s", initial_url_params)
 
-        context = context or {}
-        context["initial_url_params"] = initial_url_params
+        self._initial_url_params = initial_url_params
 
-        for record in self.request_records(context):
-            transformed_record = self.post_process(record, context)
-            if transformed_record is None:
-                # Record filtered out during post_process()
-                continue
-            yield transformed_record
+        yield from self.request_records(context)
 
     def _find_oldest_page(self, context, start_date) -> dict:
         """Finds the url params that produce that oldest partial page of results (after
@@ -271,85 +241,269 @@ class ResponsesStream(FairingStream):
         self.logger.info(
             f"No state found, looking for oldest results after start_date: {start_date}"
         )
-        start_date = dateutil.parser.isoparse(start_date)
-        params_for_start_date = self._check_start_date(context, start_date)
+        # the same for every probe, so only work them out once per search
+        url: str = self.get_url(context)
+        headers = self.http_headers
+        # probes retry failures like pages do; with several of them in flight at once,
+        # one rate limited or failed request would otherwise abort the whole sync
+        decorated_request = self.request_decorator(self._request)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            make_search_requests = functools.partial(
+                self._make_search_requests,
+                executor,
+                decorated_request,
+                context,
+                url,
+                headers,
+            )
+            params = self._search_for_oldest_page(
+                make_search_requests, _parse_iso(start_date)
+            )
+        if "until" in params:
+            self._write_search_cache(params["until"])
+        return params
+
+    def _search_for_oldest_page(self, make_search_requests, start_date) -> dict:
+        """Search for the url params of the oldest partial page after start_date.
+
+        make_search_requests sends the probes for a list of until timestamps.
+        """
+        now = datetime.now(timezone.utc)
+
+        # the first search probe and the check of a cached search result don't depend
+        # on each other, so send them together instead of waiting on two round-trips
+        cached_until = self._read_search_cache()
+        until_dts = [now]
+        if cached_until:
+            until_dts.append(cached_until)
+        now_resp, *cached_resps = make_search_requests(until_dts)
+
+        records = _loads(now_resp)["data"]
+        if len(records) == 0:
+            raise RuntimeError(
+                "Couldn't find any responses. Are you sure you've configured everything correctly?"
+            )
+        # the newest page often already reaches back past start_date, in which case it
+        # answers the start_date check without a probe of its own
+        params_for_start_date = self._check_start_date(start_date, records)
         if params_for_start_date:
             return params_for_start_date
+        if len(records) < self._probe_limit:
+            return self._partial_page_params(now)
+
+        interval_end, interval_start = now, start_date
+        # still to be checked for records before it
+        search_start_date: Optional[datetime] = start_date
+        if cached_until:
+            cached_records = _loads(cached_resps[0])["data"]
+            # only trust the cached timestamp if it still has a partial page before it
+            if 0 < len(cached_records) < self._probe_limit:
+                self.logger.info("Using cached search result %s", cached_until)
+                return self._check_start_date(
+                    start_date, cached_records
+                ) or self._partial_page_params(cached_until)
+            self.logger.info("Cached search result %s is out of date", cached_until)
+
+            # even an out of date probe narrows down where the search has to look
+            if start_date < cached_until < now:
+                if len(cached_records) == 0:
+                    # nothing before it, so nothing before start_date either
+                    interval_start = cached_until
+                    search_start_date = None
+                else:
+                    interval_end = cached_until
+
+        return self._binary_search_for_oldest(
+            make_search_requests,
+            interval_end,
+            interval_end - interval_start,
+            search_start_date,
+        )
 
-        now = datetime.now(timezone.utc)
-        return self._binary_search_for_oldest(context, now, now - start_date)
+    def _search_cache_key(self) -> str:
+        """Return the key of the cached search result for this account and config.
+
+        The key is a hash, so the token itself isn't stored in the cache.
+        """
+        key = "|".join(
+            [
+                self.config["secret_token"],
+                self.config["start_date"],
+                str(self._page_size),
+            ]
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _read_search_cache(self) -> Optional[datetime]:
+        """Return the until timestamp found by a previous search with the same config.
 
-    def _prepare_search_request(self, context, until_dt):
+        Returns None unless search_cache_path is set and holds one.
+        """
+        path = self.config.get("search_cache_path")
+        if not path:
+            return None
+        until = self._load_search_cache(Path(path)).get(self._search_cache_key())
+        if not isinstance(until, str):
+            return None
+        try:
+            return _parse_iso(until)
+        except ValueError:
+            return None
+
+    def _load_search_cache(self, path: Path) -> dict:
+        """Return the search results cached in path.
+
+        A missing or unreadable file, or one that doesn't hold a JSON object, counts
+        as an empty cache.
+        """
+        try:
+            cache = orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _write_search_cache(self, until: str) -> None:
+        """Save the until timestamp found by a search to search_cache_path, if set."""
+        path = self.config.get("search_cache_path")
+        if not path:
+            return
+        path = Path(path)
+        cache = self._load_search_cache(path)
+        cache[self._search_cache_key()] = until
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(orjson.dumps(cache))
+        except OSError as e:
+            self.logger.warning("Couldn't write search cache %s: %s", path, e)
+
+    def _prepare_search_request(self, url, headers, until_dt):
         http_method = self.rest_method
-        url: str = self.get_url(context)
-        params: dict = {
-            "until": until_dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-            "limit": 100,
-        }
-        headers = self.http_headers
+        # reusing one dict is safe: the params are encoded into the url while preparing,
+        # and probes are always prepared one at a time on the calling thread
+        self._probe_params["until"] = _format_iso(until_dt)
         return self.build_prepared_request(
             method=http_method,
             url=url,
-            params=params,
+            params=self._probe_params,
             headers=headers,
         )
 
-    def _make_search_request(self, context, until_dt):
-        prepared_request = self._prepare_search_request(context, until_dt)
-        resp = self._request(prepared_request, context)
-        resp.raise_for_status()
-        return resp
-
-    def _check_start_date(self, context, start_date):
-        """Check if there are results at the configured start_date. If so, find url params for
-        that page"""
-        resp = self._make_search_request(context, start_date)
-        records = resp.json()["data"]
-        if len(records) > 0:
-            self.logger.warn(
-                f"There are records available before start_date {start_date}. Consider removing that config if you wish to replicate all data."
+    def _make_search_requests(
+        self, executor, decorated_request, context, url, headers, until_dts
+    ) -> List[requests.Response]:
+        """Send one search probe per timestamp concurrently on executor.
+
+        The responses are returned in the same order as until_dts.
+        """
+        # requests are prepared here so only the network wait happens on the workers
+        prepared_requests = [
+            self._prepare_search_request(url, headers, until_dt)
+            for until_dt in until_dts
+        ]
+        return list(
+            executor.map(
+                lambda prepared_request: decorated_request(prepared_request, context),
+                prepared_requests,
             )
-            return {"before": records[0]["id"], "limit": self.config["page_size"]}
+        )
+
+    def _check_start_date(self, start_date, records):
+        """Check records, newest first, for any before the configured start_date.
+
+        If there are some, return the url params for the page after the newest of them.
+        """
+        for record in records:
+            if _parse_iso(record["inserted_at"]) < start_date:
+                self.logger.warn(
+                    f"There are records available before start_date {start_date}. Consider removing that config if you wish to replicate all data."
+                )
+                return {"before": record["id"], "limit": self._page_size}
 
         return False
 
-    def _binary_search_for_oldest(self, context, interval_end, interval_delta):
-        if interval_end > datetime.now(timezone.utc):
-            raise RuntimeError(
-                "Couldn't find any responses. Are you sure you've configured everything correctly?"
-            )
+    def _binary_search_for_oldest(
+        self,
+        make_search_requests,
+        interval_end,
+        interval_delta,
+        start_date: Optional[datetime] = None,
+    ):
+        """Search the interval ending at interval_end for a partial page of results.
+
+        interval_end is known to have a full page of results before it. If start_date
+        is given, the first round also checks it for records before it. Instead of
+        bisecting with one probe at a time, each round sends search_probes probes
+        spread evenly across the interval and narrows down to the bracket around the
+        first full page.
+        """
+        # each round narrows the interval by a factor of search_probes + 1, so this is
+        # far more than microsecond resolution needs. A search that can't converge, like
+        # more than page_size records inserted at the same instant, runs out of
+        # resolution first, so the limit is only a backstop.
+        for _ in range(self.max_search_rounds):
+            step = interval_delta / (self.search_probes + 1)
+            if step == timedelta(0):
+                # every later round would only resend the same probes
+                raise RuntimeError(
+                    "Couldn't find a partial page of responses: more than page_size "
+                    f"records before {_format_iso(interval_end)}"
+                )
+            interval_start = interval_end - interval_delta
+            until_dts = [
+                interval_start + step * i for i in range(1, self.search_probes + 1)
+            ]
+            if start_date is not None:
+                # the start_date check goes out with the first round of probes
+                until_dts.insert(0, start_date)
+            resps = make_search_requests(until_dts)
+            if start_date is not None:
+                until_dts.pop(0)
+                params_for_start_date = self._check_start_date(
+                    start_date, _loads(resps.pop(0))["data"]
+                )
+                if params_for_start_date:
+                    return params_for_start_date
+                start_date = None
+
+            # if every probe comes back empty, the oldest page is just before
+            # interval_end
+            next_interval_end = interval_end
+            for until_dt, resp in zip(until_dts, resps):
+                records = _loads(resp)["data"]
+                if len(records) == 0:
+                    self.logger.debug(
+                        "No records at %s, searching more recent timestamp", until_dt
+                    )
+                    continue
+                if len(records) == self._probe_limit:
+                    self.logger.debug(
+                        "Full page of records at %s, searching older timestamp",
+                        until_dt,
+                    )
+                    next_interval_end = until_dt
+                    break
+
+                return self._partial_page_params(until_dt)
+
+            interval_end = next_interval_end
+            interval_delta = step
+
+        raise RuntimeError(
+            "Couldn't find a partial page of responses after "
+            f"{self.max_search_rounds} search rounds"
+        )
 
-        resp = self._make_search_request(context, interval_end)
-        records = resp.json()["data"]
-        if len(records) == 0:
-            self.logger.debug(
-                "No records at %s, searching more recent timestamp", interval_end
-            )
-            return self._binary_search_for_oldest(
-                context, interval_end + (interval_delta / 2), interval_delta / 2
-            )
-        if len(records) == 100:
-            self.logger.debug(
-                "Full page of records at %s, searching older timestamp", interval_end
-            )
-            return self._binary_search_for_oldest(
-                context, interval_end - (interval_delta / 2), interval_delta / 2
-            )
+    def _partial_page_params(self, until_dt):
+        """Return the url params for the first page.
 
+        The probe at until_dt found a partial page of records.
+        """
         self.logger.debug(
-            "Found a partial page of records at %s, returning first page", interval_end
+            "Found a partial page of records at %s, returning first page", until_dt
         )
-        if len(records) < self.config["page_size"]:
-            return {
-                "until": interval_end.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-                "limit": self.config["page_size"],
-            }
-
-        # yes, their API returns datetimes in a format they don't accept :facepalm:
-        until_time = dateutil.parser.isoparse(
-            records[-self.config["page_size"]]["inserted_at"]
-        ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-        return {"until": until_time, "limit": self.config["page_size"]}
+        # probes use the replication page size, or two records when that's one and the
+        # partial page is a single record, so the partial page is the first page
+        return {"until": _format_iso(until_dt), "limit": self._page_size}
 
     def get_url_params(
         self, context: Optional[dict], next_page_token: Optional[_TToken]
@@ -366,56 +520,20 @@ class ResponsesStream(FairingStream):
         Returns:
             Dictionary of URL query parameters to use in the request.
         """
-        if "initial_url_params" in context:
-            params = context["initial_url_params"]
-            del context["initial_url_params"]
-            return params
-        elif next_page_token:
-            return {"before": next_page_token, "limit": self.config["page_size"]}
+        if next_page_token:
+            return {"before": next_page_token, "limit": self._page_size}
+        elif self._initial_url_params is not None:
+            # first page of the sync
+            return self._initial_url_params
         else:
             # this should never happen, maybe raise?
-            return {"limit": self.config["page_size"]}
-
-    def post_process(self, row: Dict, context: Optional[dict] = None) -> Optional[dict]:
-        """Fairing responses: transform the number types into floats for loading, and
-        the foreign key ids to strings like in questions.
-
-        As needed, append or transform raw data to match expected structure.
-
-        Optional. This method gives developers an opportunity to "clean up" the results
-        prior to returning records to the downstream tap - for instance: cleaning,
-        renaming, or appending properties to the raw record result returned from the
-        API.
-
-        Developers may also return `None` from this method to filter out
-        invalid or not-applicable records from the stream.
-
-        Args:
-            row: Individual record in the stream.
-            context: Stream partition or context dictionary.
-
-        Returns:
-            The resulting record dict, or `None` if the record should be excluded.
-
-        """
-        if "order_total" in row and row["order_total"]:
-            row["order_total"] = float(row["order_total"])
-        if "order_total_usd" in row and row["order_total_usd"]:
-            row["order_total_usd"] = float(row["order_total_usd"])
-
-        if "question_id" in row and row["question_id"]:
-            row["question_id"] = str(row["question_id"])
-        if "referring_question_id" in row and row["referring_question_id"]:
-            row["referring_question_id"] = str(row["referring_question_id"])
-        if "referring_question_response_id" in row and row["referring_question_response_id"]:
-            row["referring_question_response_id"] = str(row["referring_question_response_id"])
-        if "response_id" in row and row["response_id"]:
-            row["response_id"] = str(row["response_id"])
-        return row
+            return {"limit": self._page_size}
 
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """Fairing: Since the records are always returned in descending time order, we
-        have to reverse the results in order to update the state correctly.
+        have to reverse the results in order to update the state correctly. In the same
+        pass, transform the number types into floats for loading, and the foreign key
+        ids to strings like in questions.
 
         Parse the response and return an iterator of result records.
 
@@ -429,9 +547,11 @@ class ResponsesStream(FairingStream):
             https://requests.readthedocs.io/en/latest/api/#requests.Response
 
         """
-        data: List = response.json()["data"]
-        data.reverse()
-        yield from data
+        if self.records_jsonpath == "$.data[*]":
+            data: List = _loads(response)["data"]
+        else:
+            data = list(extract_jsonpath(self.records_jsonpath, input=_loads(response)))
+        yield from _transform_page(data)
 
 
 class QuestionsStream(FairingStream):
@@ -439,153 +559,7 @@ class QuestionsStream(FairingStream):
     path = "/questions"
     primary_keys = ["id"]
 
-    schema = th.PropertiesList(
-        th.Property(
-            "allow_other",
-            th.BooleanType,
-            description="If true, the question allows a free-text responses as an alternative to the provided list of responses.",
-        ),
-        th.Property(
-            "customer_type",
-            th.StringType,
-            description="One of everyone, new, or returning. Indicates which customers should be asked this question.",
-        ),
-        th.Property(
-            "frequency_type",
-            th.StringType,
-            description="Either always or once. Indicates how often this question should be asked.",
-        ),
-        th.Property(
-            "id", th.StringType, description="The unique identifier of the question."
-        ),
-        th.Property(
-            "inserted_at",
-            th.StringType,
-            description="ISO 8601 timestamp of the time the question was created.",
-        ),
-        th.Property(
-            "max_responses",
-            th.IntegerType,
-            description="If the question type is multi_response, this is the maximum number of responses that can be provided for this question per customer.",
-        ),
-        th.Property(
-            "other_placeholder",
-            th.StringType,
-            description='If the question allows free text responses ("Other"), this is the placeholder text that displays in the text input in the question form.',
-        ),
-        th.Property(
-            "prompt",
-            th.StringType,
-            description="The text value of the question that is presented to customers.",
-        ),
-        th.Property(
-            "published_at",
-            th.StringType,
-            description="ISO 8601 timestamp of the time the question was published. If it has not been pbulished, this will be null.",
-        ),
-        th.Property(
-            "randomize_responses",
-            th.BooleanType,
-            description="If this is true the order of the responses will be randomized every time the question is displayed to prevent bias in the collected responses.",
-        ),
-        th.Property(
-            "responses",
-            th.ArrayType(
-                th.ObjectType(
-                    th.Property(
-                        "clarification_question",
-                        th.ObjectType(
-                            th.Property(
-                                "allow_other",
-                                th.BooleanType,
-                                description="If true, the question allows a free-text responses as an alternative to the provided list of responses. ",
-                            ),
-                            th.Property(
-                                "id",
-                                th.StringType,
-                                description="The unique identifier of the question. ",
-                            ),
-                            th.Property(
-                                "max_responses",
-                                th.IntegerType,
-                                description="If the question type is multi_response, this is the maximum number of responses that can be provided for this question per customer. ",
-                            ),
-                            th.Property(
-                                "other_placeholder",
-                                th.StringType,
-                                description='If the question allows free text responses ("Other"), this is the placeholder text that displays in the text input in the question form. ',
-                            ),
-                            th.Property(
-                                "prompt",
-                                th.StringType,
-                                description="The text value of the question that is presented to customers. ",
-                            ),
-                            th.Property(
-                                "randomize_responses",
-                                th.BooleanType,
-                                description="If this is true the order of the responses will be randomized every time the question is displayed to prevent bias in the collected responses. ",
-                            ),
-                            th.Property(
-                                "responses",
-                                th.ArrayType(
-                                    th.ObjectType(
-                                        th.Property(
-                                            "id",
-                                            th.StringType,
-                                            description="The unique identifier of the response. ",
-                                        ),
-                                        th.Property(
-                                            "value",
-                                            th.StringType,
-                                            description="The text value of the response that is presented to the customer. ",
-                                        ),
-                                    )
-                                ),
-                                description="For single_response or multi_response question types, a list of response objects. The difference between a response object on a question and a response object on a clarification question is that response objects on a clarification question *cannot* have a clarification_question attribute. ",
-                            ),
-                            th.Property(
-                                "submit_text",
-                                th.StringType,
-                                description="The text that is displayed on the button that submits the question form. ",
-                            ),
-                            th.Property(
-                                "type",
-                                th.StringType,
-                                description="One of single_response, multi_response, or open_ended. The single_response question type limits the customer to providing one response to the question. The multi_response type allows a customer to provide many responses, up to the limit of the max_responses value. The open_ended type allows customers to respond with free form text.",
-                            ),
-                        ),
-                        description="If the type of the question associated with this response is single_response, then the response can have follow up clarification question object. A clarification question provides a mechanism to add more detail to the response. ",
-                    ),
-                    th.Property(
-                        "id",
-                        th.StringType,
-                        description="The unique identifier of the response. ",
-                    ),
-                    th.Property(
-                        "value",
-                        th.StringType,
-                        description="The text value of the response that is presented to the customer. ",
-                    ),
-                )
-            ),
-            description="For single_response or multi_response question types, a list of response objects.",
-        ),
-        th.Property(
-            "submit_text",
-            th.StringType,
-            description="The text that is displayed on the button that submits the question form.",
-        ),
-        th.Property(
-            "type",
-            th.StringType,
-            description="One of single_response, multi_response, or open_ended. The single_response question type limits the customer to providing one response to the question. The multi_response type allows a customer to provide many responses, up to the limit of the max_responses value. The open_ended type allows customers to respond with free form text.",
-        ),
-        th.Property(
-            "updated_at",
-            th.StringType,
-            description="ISO 8601 timestamp of the time the question was last updated.",
-        ),
-    ).to_dict()
+    schema_filepath = SCHEMAS_DIR / "questions.json"
 
     def post_process(self, row: Dict, context: Optional[dict] = None) -> Optional[dict]:
         """Fairing questions: transform the id types to strings
@@ -607,11 +581,16 @@ class QuestionsStream(FairingStream):
         Returns:
             The resulting record dict, or `None` if the record should be excluded.
         """
-        row["id"] = str(row["id"])
+        # collect every object with an id first: the question, its responses, and any
+        # clarification question with its own responses
+        targets = [row]
         for resp in row["responses"]:
-            resp["id"] = str(resp["id"])
-            if "clarification_question" in resp and resp["clarification_question"]:
-                resp["clarification_question"]["id"] = str(resp["clarification_question"]["id"])
-                for clarification_resp in resp["clarification_question"]["responses"]:
-                    clarification_resp["id"] = str(clarification_resp["id"])
+            targets.append(resp)
+            clarification_question = resp.get("clarification_question")
+            if clarification_question:
+                targets.append(clarification_question)
+                targets.extend(clarification_question["responses"])
+
+        for target in targets:
+            target["id"] = str(target["id"])
         return row
@@ -40,6 +40,24 @@ class Tapfairing(Tap):
             default=100,
             description="The page size for each responses endpoint call",
         ),
+        th.Property(
+            "search_probes",
+            th.IntegerType,
+            default=4,
+            description=(
+                "The number of requests sent at once by each round of the search for "
+                "the oldest responses. Lower it if the API rate limits the tap, 1 "
+                "searches one request at a time"
+            ),
+        ),
+        th.Property(
+            "search_cache_path",
+            th.StringType,
+            description=(
+                "A file to cache the result of the search for the oldest responses "
+                "in, so that later syncs without state can skip it"
+            ),
+        ),
     ).to_dict()
 
     def discover_streams(self) -> List[Stream]:
@@ -0,0 +1,398 @@
+"""Tests the responses stream against a fake fairing.co API."""
+
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlparse
+
+import backoff
+import orjson
+import pytest
+import requests
+from singer_sdk.exceptions import RetriableAPIError
+
+from tap_fairing.tap import Tapfairing
+
+BASE_TIME = datetime(2021, 3, 1, tzinfo=timezone.utc)
+
+
+class FakeResponsesAPI:
+    """Serve /responses pages from an in-memory list of records, oldest first."""
+
+    def __init__(self, records, rate_limited=0):
+        """Create the fake API.
+
+        Args:
+            records: The records in the account, oldest first.
+            rate_limited: How many requests with an until timestamp to turn away
+                first, like the API does when it rate limits the tap.
+        """
+        self.records = records
+        self.rate_limited = rate_limited
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def _request(self, prepared_request, context):
+        """Answer a request the way the API does, newest record first.
+
+        Args:
+            prepared_request: The request the stream would have sent.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The fake API response.
+        """
+        params = {
+            k: v[0] for k, v in parse_qs(urlparse(prepared_request.url).query).items()
+        }
+        with self._lock:
+            self.requests.append(params)
+            rate_limited = "until" in params and self.rate_limited > 0
+            if rate_limited:
+                self.rate_limited -= 1
+        if rate_limited:
+            # what validate_response raises for a 429
+            raise RetriableAPIError("429 Client Error: Too Many Requests")
+        limit = int(params["limit"])
+        if "until" in params:
+            until = _parse(params["until"])
+            data = [r for r in self.records if _parse(r["inserted_at"]) < until]
+            data = data[::-1][:limit]
+        elif "before" in params:
+            # ids increase with inserted_at, and before pages forward in time
+            data = [r for r in self.records if r["id"] > int(params["before"])]
+            data = data[:limit][::-1]
+        else:
+            data = self.records[::-1][:limit]
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = orjson.dumps({"data": [dict(r) for r in data]})
+        response.request = prepared_request
+        response.url = prepared_request.url
+        return response
+
+    def search_requests(self):
+        """Return the params of every request sent with an until timestamp.
+
+        These are the search probes, and the first page of a sync without state.
+        """
+        return [params for params in self.requests if "until" in params]
+
+
+def _parse(value):
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _make_records(rng, count):
+    """Return count records a random number of seconds to days apart, oldest first.
+
+    inserted_at has no utc offset, like the API sends it.
+    """
+    records = []
+    inserted_at = BASE_TIME
+    for i in range(1, count + 1):
+        inserted_at += timedelta(seconds=rng.choice([1, 37, 3600, 86400 * 3]))
+        inserted_at += timedelta(microseconds=rng.randrange(1000000))
+        records.append(
+            {
+                "id": i,
+                "inserted_at": inserted_at.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+                "order_total": "12.50",
+                "question_id": 5,
+            }
+        )
+    return records
+
+
+def _responses_stream(state=None, **config):
+    tap = Tapfairing(
+        config={"secret_token": "supersecret", **config},
+        state=state,
+        parse_env_config=False,
+    )
+    return tap.streams["responses"]
+
+
+def _no_backoff_wait():
+    return backoff.constant(interval=0)
+
+
+def _sync_responses(monkeypatch, api, stream=None, **config):
+    """Run a sync of the responses stream against api, without state unless stream has.
+
+    Returns:
+        The records the stream emitted, in order.
+    """
+    stream = stream or _responses_stream(**config)
+    emitted = []
+    monkeypatch.setattr(stream, "_request", api._request)
+    monkeypatch.setattr(stream, "_write_record_message", emitted.append)
+    monkeypatch.setattr(stream, "backoff_wait_generator", _no_backoff_wait)
+    stream.sync()
+    return emitted
+
+
+def _expected_ids(records, start_date):
+    start_date = _parse(start_date)
+    return [r["id"] for r in records if _parse(r["inserted_at"]) >= start_date]
+
+
+@pytest.mark.parametrize("search_probes", [1, 2, 4, 8])
+@pytest.mark.parametrize("page_size", [2, 7, 100])
+@pytest.mark.parametrize("count", [1, 7, 250])
+def test_sync_without_state(monkeypatch, search_probes, page_size, count):
+    """A sync without state emits every record, oldest first."""
+    records = _make_records(random.Random(count * page_size), count)
+    api = FakeResponsesAPI(records)
+
+    emitted = _sync_responses(
+        monkeypatch, api, page_size=page_size, search_probes=search_probes
+    )
+
+    assert [r["id"] for r in emitted] == [r["id"] for r in records]
+    assert all(params["limit"] == str(page_size) for params in api.requests)
+
+
+@pytest.mark.parametrize("search_probes", [1, 2, 4, 8])
+@pytest.mark.parametrize("page_size", [2, 7, 100])
+def test_sync_from_start_date(monkeypatch, search_probes, page_size):
+    """A sync without state emits only the records from start_date on, oldest first."""
+    records = _make_records(random.Random(page_size), 400)
+    api = FakeResponsesAPI(records)
+    # between two records, with older ones before it
+    start_date = _parse(records[150]["inserted_at"]) - timedelta(microseconds=1)
+    start_date = start_date.isoformat().replace("+00:00", "Z")
+
+    emitted = _sync_responses(
+        monkeypatch,
+        api,
+        page_size=page_size,
+        search_probes=search_probes,
+        start_date=start_date,
+    )
+
+    assert [r["id"] for r in emitted] == _expected_ids(records, start_date)
+    assert emitted[0]["id"] == 151
+
+
+@pytest.mark.parametrize("page_size", [1, 7, 100])
+def test_sync_with_state(monkeypatch, page_size):
+    """A sync with state pages on from the bookmark, without searching."""
+    records = _make_records(random.Random(8), 300)
+    api = FakeResponsesAPI(records)
+    state = {
+        "bookmarks": {
+            "responses": {"replication_key": "id", "replication_key_value": 120}
+        }
+    }
+    stream = _responses_stream(state=state, page_size=page_size)
+
+    emitted = _sync_responses(monkeypatch, api, stream=stream)
+
+    assert [r["id"] for r in emitted] == list(range(121, 301))
+    assert api.search_requests() == []
+    assert api.requests[0] == {"before": "120", "limit": str(page_size)}
+    # every later page starts after the newest record of the one before it, until
+    # one comes back empty
+    ids = [r["id"] for r in emitted]
+    pages = [ids[i:][:page_size] for i in range(0, len(ids), page_size)]
+    assert [params["before"] for params in api.requests] == [
+        str(newest_id) for newest_id in [120] + [page[-1] for page in pages]
+    ]
+    assert stream.get_context_state(None)["replication_key_value"] == 300
+
+
+def test_sync_random_cases(monkeypatch):
+    """Stateless syncs of random accounts and start_dates emit the right records."""
+    rng = random.Random(0)
+    for _ in range(30):
+        records = _make_records(rng, rng.randrange(1, 600))
+        start_date = rng.choice(
+            [
+                "2010-01-01T00:00:00Z",
+                rng.choice(records)["inserted_at"] + "Z",
+                (BASE_TIME + timedelta(days=rng.randrange(200))).isoformat(),
+            ]
+        )
+        api = FakeResponsesAPI(records)
+
+        emitted = _sync_responses(
+            monkeypatch,
+            api,
+            page_size=rng.randrange(2, 120),
+            search_probes=rng.choice([1, 2, 4, 8]),
+            start_date=start_date,
+        )
+
+        assert [r["id"] for r in emitted] == _expected_ids(records, start_date)
+
+
+@pytest.mark.parametrize("start_date", ["2021-03-10T00:00:00", "2021-03-10"])
+def test_sync_from_naive_start_date(monkeypatch, start_date):
+    """A start_date without a utc offset is read as utc."""
+    records = _make_records(random.Random(1), 300)
+    api = FakeResponsesAPI(records)
+
+    emitted = _sync_responses(monkeypatch, api, page_size=20, start_date=start_date)
+
+    assert [r["id"] for r in emitted] == _expected_ids(records, start_date + "Z")
+
+
+@pytest.mark.parametrize("utc_offset_hours", [-8, 5.5])
+def test_sync_from_start_date_with_offset(monkeypatch, utc_offset_hours):
+    """A start_date in another timezone is probed at the same instant in utc."""
+    records = _make_records(random.Random(1), 300)
+    api = FakeResponsesAPI(records)
+    tz = timezone(timedelta(hours=utc_offset_hours))
+    # between two records, with older ones before it
+    start_date = _parse(records[156]["inserted_at"]) - timedelta(microseconds=1)
+    start_date = start_date.astimezone(tz).isoformat()
+
+    emitted = _sync_responses(monkeypatch, api, page_size=20, start_date=start_date)
+
+    assert [r["id"] for r in emitted] == _expected_ids(records, start_date)
+    assert emitted[0]["id"] == 157
+
+
+@pytest.mark.parametrize("rate_limited", [1, 3])
+def test_sync_retries_rate_limited_probes(monkeypatch, rate_limited):
+    """Search probes turned away by the API are retried, like pages are."""
+    records = _make_records(random.Random(7), 250)
+    api = FakeResponsesAPI(records, rate_limited=rate_limited)
+
+    emitted = _sync_responses(monkeypatch, api, page_size=20)
+
+    assert [r["id"] for r in emitted] == [r["id"] for r in records]
+    assert api.rate_limited == 0
+
+
+def test_sync_empty_account(monkeypatch):
+    """A sync of an account without any responses fails instead of emitting nothing."""
+    api = FakeResponsesAPI([])
+
+    with pytest.raises(RuntimeError, match="Couldn't find any responses"):
+        _sync_responses(monkeypatch, api)
+
+
+def test_search_gives_up_without_resolution(monkeypatch):
+    """The search stops once the interval can't be split, instead of re-probing it."""
+    inserted_at = (BASE_TIME + timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S.%f")
+    records = [{"id": i, "inserted_at": inserted_at} for i in range(1, 11)]
+    api = FakeResponsesAPI(records)
+
+    with pytest.raises(RuntimeError, match="Couldn't find a partial page"):
+        _sync_responses(monkeypatch, api, page_size=5, search_probes=4)
+    # five probes a round, and narrowing the years since start_date down to a
+    # microsecond takes about 21 rounds
+    assert len(api.search_requests()) < 5 * 30
+
+
+@pytest.mark.parametrize("search_probes", [1, 4])
+def test_sync_page_size_of_one(monkeypatch, search_probes):
+    """A page of one record can't be partial, so the search probes two at a time."""
+    records = _make_records(random.Random(6), 150)
+    api = FakeResponsesAPI(records)
+    start_date = records[40]["inserted_at"] + "Z"
+
+    emitted = _sync_responses(
+        monkeypatch, api, page_size=1, search_probes=search_probes
+    )
+    assert [r["id"] for r in emitted] == [r["id"] for r in records]
+
+    api = FakeResponsesAPI(records)
+    emitted = _sync_responses(
+        monkeypatch,
+        api,
+        page_size=1,
+        search_probes=search_probes,
+        start_date=start_date,
+    )
+    assert [r["id"] for r in emitted] == _expected_ids(records, start_date)
+    assert all(params["limit"] == "1" for params in api.requests if "before" in params)
+
+
+def _cache_config(tmp_path):
+    return {"page_size": 20, "search_cache_path": str(tmp_path / "cache.json")}
+
+
+def _write_cache(config, until):
+    key = _responses_stream(**config)._search_cache_key()
+    with open(config["search_cache_path"], "wb") as f:
+        f.write(orjson.dumps({key: until}))
+
+
+def _read_cache(config):
+    with open(config["search_cache_path"], "rb") as f:
+        return orjson.loads(f.read())
+
+
+def test_search_cache_fresh(monkeypatch, tmp_path):
+    """A search without a cache saves its result for the next one."""
+    records = _make_records(random.Random(2), 250)
+    config = _cache_config(tmp_path)
+
+    emitted = _sync_responses(monkeypatch, FakeResponsesAPI(records), **config)
+
+    assert [r["id"] for r in emitted] == [r["id"] for r in records]
+    key = _responses_stream(**config)._search_cache_key()
+    assert list(_read_cache(config)) == [key]
+
+
+def test_search_cache_still_valid(monkeypatch, tmp_path):
+    """A cached result that still finds a partial page skips the search."""
+    records = _make_records(random.Random(3), 250)
+    config = _cache_config(tmp_path)
+    _sync_responses(monkeypatch, FakeResponsesAPI(records), **config)
+    cached = _read_cache(config)
+    api = FakeResponsesAPI(records)
+
+    emitted = _sync_responses(monkeypatch, api, **config)
+
+    assert [r["id"] for r in emitted] == [r["id"] for r in records]
+    # the newest page and the cached timestamp sent together, then the first page
+    assert len(api.search_requests()) == 3
+    assert api.requests[2] == api.requests[1]
+    assert _read_cache(config) == cached
+
+
+@pytest.mark.parametrize(
+    "cached_index",
+    [
+        # a full page of records before the cached timestamp
+        -1,
+        # no records at all before it
+        0,
+    ],
+)
+def test_search_cache_out_of_date(monkeypatch, tmp_path, cached_index):
+    """An out of date cached result is searched past and replaced."""
+    records = _make_records(random.Random(4), 250)
+    config = _cache_config(tmp_path)
+    until = records[cached_index]["inserted_at"] + "Z"
+    _write_cache(config, until)
+    api = FakeResponsesAPI(records)
+
+    emitted = _sync_responses(monkeypatch, api, **config)
+
+    assert [r["id"] for r in emitted] == [r["id"] for r in records]
+    assert len(api.search_requests()) > 3
+    new_until = list(_read_cache(config).values())
+    assert new_until != [until]
+    assert len(new_until) == 1
+
+
+@pytest.mark.parametrize("content", [b"[]", b'"x"', b"not json", b'{"a": 1}'])
+def test_search_cache_not_a_cache(monkeypatch, tmp_path, content):
+    """A cache file without cached results in it is ignored and overwritten."""
+    records = _make_records(random.Random(5), 250)
+    config = _cache_config(tmp_path)
+    with open(config["search_cache_path"], "wb") as f:
+        f.write(content)
+
+    emitted = _sync_responses(monkeypatch, FakeResponsesAPI(records), **config)
+
+    assert [r["id"] for r in emitted] == [r["id"] for r in records]
+    key = _responses_stream(**config)._search_cache_key()
+    assert key in _read_cache(config)